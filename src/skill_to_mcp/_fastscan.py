@@ -0,0 +1,61 @@
+"""Accelerated frontmatter scanner for large skill libraries.
+
+Extracts the ``name`` and ``description`` fields directly from a SKILL.md
+byte buffer using memchr-style ``bytes.find`` searches, without decoding the
+buffer or involving the YAML machinery. The scanner is deliberately
+conservative: anything that is not a flat ``key: value`` block makes it
+return None so the caller falls back to the full parser, which keeps error
+reporting for malformed frontmatter unchanged.
+
+The module is self-contained so it can be swapped for a compiled (Cython or
+similar) implementation without touching the caller.
+"""
+
+
+def extract_name_desc(buf: bytes) -> tuple[str, str] | None:
+    """Extract name and description from a SKILL.md byte buffer.
+
+    Parameters
+    ----------
+    buf : bytes
+        Leading bytes of a SKILL.md file, covering at least the frontmatter
+        block.
+
+    Returns
+    -------
+    tuple[str, str] | None
+        (name, description) if the buffer starts with a flat key/value
+        frontmatter block containing both fields, otherwise None.
+    """
+    if not buf.startswith(b"---"):
+        return None
+    start = buf.find(b"\n")
+    if start < 0 or buf[3:start].strip():
+        return None
+    end = buf.find(b"\n---", start)
+    if end < 0:
+        return None
+
+    name = None
+    description = None
+    for line in buf[start + 1 : end].split(b"\n"):
+        if not line.strip() or line.lstrip().startswith(b"#"):
+            continue
+        # Indented lines, list items, and flow collections need real YAML
+        if line[:1] in (b" ", b"\t", b"-", b"{", b"["):
+            return None
+        key, sep, value = line.partition(b":")
+        if not sep:
+            return None
+        # Inline comments (and '#' inside quoted scalars) need real YAML
+        if b"#" in value:
+            return None
+        key = key.strip()
+        if key == b"name":
+            name = value.strip().strip(b'"').strip(b"'")
+        elif key == b"description":
+            description = value.strip().strip(b'"').strip(b"'")
+
+    if name is None or description is None:
+        return None
+    return name.decode("utf-8"), description.decode("utf-8")
@@ -1,15 +1,70 @@
+import functools
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from fastmcp import FastMCP
 
+if TYPE_CHECKING:
+    from skill_to_mcp.skill_parser import SkillParser
 
-def initialize_mcp(skills_dir: str | Path) -> FastMCP:
+try:
+    # Optional C-backed JSON serialization for tool results
+    import orjson
+
+    def _tool_serializer(data: Any) -> str:
+        """Serialize a tool result to JSON text using orjson.
+
+        Parameters
+        ----------
+        data : Any
+            Structured tool return value (lists/dicts of strings here).
+
+        Returns
+        -------
+        str
+            JSON text for the tool response content.
+        """
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:  # pragma: no cover
+    # FastMCP falls back to its built-in serializer
+    _tool_serializer = None
+
+
+def initialize_mcp(skills_dir: str | Path, parser: "SkillParser | None" = None) -> FastMCP:
     """Initialize the FastMCP server with a specific skills directory.
 
+    Repeated calls for the same directory (after path resolution) return the
+    same server instance instead of rebuilding the tool registrations; use
+    ``initialize_mcp.cache_clear()`` to force a rebuild.
+
     Parameters
     ----------
     skills_dir : str | Path
         Path to the directory containing skill subdirectories with SKILL.md files.
+    parser : SkillParser | None
+        Existing skill parser to back the tools with instead of creating a
+        new one, so callers can share one parser (and its caches) between
+        the server and direct use.
+
+    Returns
+    -------
+    FastMCP
+        Initialized MCP server with skill tools registered.
+    """
+    return _initialize_mcp_cached(str(Path(skills_dir).resolve()), parser)
+
+
+@functools.lru_cache(maxsize=4)
+def _initialize_mcp_cached(skills_dir: str, parser: "SkillParser | None" = None) -> FastMCP:
+    """Build the FastMCP server for a resolved skills directory path.
+
+    Parameters
+    ----------
+    skills_dir : str
+        Resolved path of the skills directory; part of the cache key.
+    parser : SkillParser | None
+        Existing skill parser to reuse; part of the cache key.
 
     Returns
     -------
@@ -25,15 +80,19 @@ def initialize_mcp(skills_dir: str | Path) -> FastMCP:
             "see what's available, then get_skill_details to access specific skills."
         ),
         on_duplicate_tools="error",
+        tool_serializer=_tool_serializer,
     )
 
     # Register tools with the configured skills directory
     from skill_to_mcp.tools._skills import register_skill_tools
 
-    register_skill_tools(mcp_server, skills_dir)
+    register_skill_tools(mcp_server, skills_dir, skill_parser=parser)
 
     return mcp_server
 
 
+initialize_mcp.cache_clear = _initialize_mcp_cached.cache_clear  # type: ignore[attr-defined]
+
+
 # Default instance for testing (uses package's skills directory)
 mcp: FastMCP | None = None
@@ -1,30 +1,100 @@
 """Skill parser module for processing SKILL.md files and skill directories."""
 
-import re
+import functools
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
 
-class SkillMetadata:
-    """Represents metadata from a SKILL.md file."""
+try:
+    # Optional accelerated scanner; falls back to the full parser if absent
+    from skill_to_mcp._fastscan import extract_name_desc as _extract_name_desc
+except ImportError:  # pragma: no cover
+    _extract_name_desc = None
 
-    def __init__(self, name: str, description: str, skill_path: Path):
-        """Initialize skill metadata.
 
-        Parameters
-        ----------
-        name : str
-            Skill name from frontmatter.
-        description : str
-            Skill description from frontmatter.
-        skill_path : Path
-            Path to the directory containing the SKILL.md file.
-        """
-        self.name = name
-        self.description = description
-        self.skill_path = skill_path
+logger = logging.getLogger(__name__)
+
+# Directories that never contain skill content and can be large
+_SKIP_DIRS = {".git", "__pycache__", ".venv", "venv", "node_modules", ".mypy_cache"}
+
+
+@functools.lru_cache(maxsize=128)
+def _read_text_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a file's text, cached by path and modification time.
+
+    Parameters
+    ----------
+    path_str : str
+        Absolute path to the file.
+    mtime_ns : int
+        The file's st_mtime_ns; part of the cache key so edits invalidate
+        the entry automatically.
+
+    Returns
+    -------
+    str
+        Decoded file content.
+    """
+    return Path(path_str).read_text(encoding="utf-8")
+
+
+def _read_text(path: Path) -> str:
+    """Read a file's text, going through the mtime-keyed cache by default.
+
+    Setting the ``SKILL_TO_MCP_NO_CACHE`` environment variable bypasses the
+    cache entirely and reads straight from disk.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Decoded file content.
+    """
+    if os.environ.get("SKILL_TO_MCP_NO_CACHE"):
+        return path.read_text(encoding="utf-8")
+    return _read_text_cached(str(path), path.stat().st_mtime_ns)
+
+
+@dataclass(slots=True)
+class SkillMetadata:
+    """Represents metadata from a SKILL.md file.
+
+    Parameters
+    ----------
+    name : str
+        Skill name from frontmatter.
+    description : str
+        Skill description from frontmatter.
+    skill_path : Path
+        Path to the directory containing the SKILL.md file.
+    """
+
+    name: str
+    description: str
+    skill_path: Path
+    resolved_path: Path = field(init=False)
+
+    def __post_init__(self):
+        # Resolved once here so per-request path validation doesn't repeat
+        # the realpath syscalls
+        self.resolved_path = self.skill_path.resolve()
 
     def to_dict(self) -> dict[str, str]:
         """Convert metadata to dictionary.
@@ -44,37 +114,183 @@ class SkillMetadata:
 class SkillParser:
     """Parser for Claude Skills following the SKILL.md format."""
 
-    def __init__(self, skills_directory: Path | str = "skills"):
+    def __init__(self, skills_directory: Path | str = "skills", deep_scan: bool = False):
         """Initialize the skill parser.
 
         Parameters
         ----------
         skills_directory : Path | str
             Path to the directory containing skill subdirectories.
+        deep_scan : bool
+            If True, search for SKILL.md files at any depth below the skills
+            directory. By default only the top level of each skill
+            subdirectory is checked, matching the Claude Skills convention.
         """
         self.skills_directory = Path(skills_directory)
+        self.deep_scan = deep_scan
         if not self.skills_directory.exists():
             raise ValueError(f"Skills directory does not exist: {self.skills_directory}")
+        self._skills_cache: list[SkillMetadata] | None = None
+        self._skills_by_name: dict[str, SkillMetadata] = {}
+        self._cache_manifest: list[list] | None = None
 
     def find_all_skills(self) -> list[SkillMetadata]:
         """Find all SKILL.md files and parse their metadata.
 
+        Results are cached in memory and validated against a manifest of the
+        SKILL.md files on disk (path, mtime, size), so repeated calls skip
+        re-parsing frontmatter; in-place edits change the manifest and force
+        a re-scan. Building the manifest is one scandir plus a stat per
+        skill, so validation stays cheap.
+
         Returns
         -------
         list[SkillMetadata]
             List of skill metadata objects.
         """
-        skills = []
-        for skill_md in self.skills_directory.rglob("SKILL.md"):
-            try:
-                metadata = self.parse_skill_metadata(skill_md)
-                skills.append(metadata)
-            except (ValueError, OSError) as e:
-                # Log error but continue processing other skills
-                print(f"Error parsing {skill_md}: {e}")
-                continue
+        manifest = self._build_manifest()
+        if self._skills_cache is not None and manifest == self._cache_manifest:
+            return self._skills_cache
+
+        skills = self._load_snapshot(manifest)
+        if skills is None:
+            paths = [Path(entry[0]) for entry in manifest]
+            if len(paths) > 4:
+                # Parsing is dominated by blocking reads which release the
+                # GIL, so overlap them; small directories skip the pool
+                # overhead
+                with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+                    results = list(executor.map(self._parse_skill_or_none, paths))
+            else:
+                results = [self._parse_skill_or_none(skill_md) for skill_md in paths]
+            skills = [metadata for metadata in results if metadata is not None]
+            self._write_snapshot(manifest, skills)
+
+        self._skills_cache = skills
+        self._skills_by_name = {skill.name: skill for skill in skills}
+        self._cache_manifest = manifest
         return skills
 
+    def _snapshot_path(self) -> Path:
+        """Location of the on-disk scan snapshot for this skills directory.
+
+        Returns
+        -------
+        Path
+            Snapshot file under ``~/.cache/skill-to-mcp``, unique per skills
+            directory.
+        """
+        digest = hashlib.sha1(str(self.skills_directory.resolve()).encode("utf-8")).hexdigest()[:16]
+        return Path.home() / ".cache" / "skill-to-mcp" / f"skills-{digest}.json"
+
+    def _build_manifest(self) -> list[list]:
+        """Build a manifest describing the current SKILL.md files on disk.
+
+        Returns
+        -------
+        list[list]
+            One ``[path, st_mtime_ns, st_size]`` entry per candidate
+            SKILL.md, in scan order.
+        """
+        manifest = []
+        for path in self._iter_skill_md_paths():
+            stat = path.stat()
+            manifest.append([str(path), stat.st_mtime_ns, stat.st_size])
+        return manifest
+
+    def _load_snapshot(self, manifest: list[list]) -> list[SkillMetadata] | None:
+        """Hydrate skill metadata from the disk snapshot if still valid.
+
+        Parameters
+        ----------
+        manifest : list[list]
+            Manifest of the files currently on disk; the snapshot is only
+            used when its recorded manifest matches exactly.
+
+        Returns
+        -------
+        list[SkillMetadata] | None
+            Cached metadata, or None on a cache miss or unreadable snapshot.
+        """
+        try:
+            data = json.loads(self._snapshot_path().read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        # A truncated or tampered snapshot can be valid JSON of another shape
+        if not isinstance(data, dict) or data.get("manifest") != manifest:
+            return None
+        try:
+            return [
+                SkillMetadata(
+                    name=entry["name"],
+                    description=entry["description"],
+                    skill_path=Path(entry["path"]),
+                )
+                for entry in data["skills"]
+            ]
+        except (KeyError, TypeError):
+            return None
+
+    def _write_snapshot(self, manifest: list[list], skills: list[SkillMetadata]) -> None:
+        """Persist scan results so the next cold start skips re-parsing.
+
+        Parameters
+        ----------
+        manifest : list[list]
+            Manifest the scan was based on.
+        skills : list[SkillMetadata]
+            Parsed metadata to persist.
+        """
+        snapshot_path = self._snapshot_path()
+        try:
+            snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = {"manifest": manifest, "skills": [skill.to_dict() for skill in skills]}
+            snapshot_path.write_text(json.dumps(payload), encoding="utf-8")
+        except OSError as e:
+            # The snapshot is purely an optimization; never fail the scan
+            logger.debug("Could not write skills snapshot %s: %s", snapshot_path, e)
+
+    def _parse_skill_or_none(self, skill_md_path: Path) -> SkillMetadata | None:
+        """Parse a SKILL.md file, returning None instead of raising.
+
+        Parameters
+        ----------
+        skill_md_path : Path
+            Path to the SKILL.md file.
+
+        Returns
+        -------
+        SkillMetadata | None
+            Parsed metadata, or None if the file could not be parsed.
+        """
+        try:
+            return self.parse_skill_metadata(skill_md_path)
+        except (ValueError, OSError) as e:
+            # Log error but continue processing other skills
+            logger.warning("Error parsing %s: %s", skill_md_path, e)
+            return None
+
+    def _iter_skill_md_paths(self) -> list[Path]:
+        """Collect candidate SKILL.md paths in the skills directory.
+
+        Returns
+        -------
+        list[Path]
+            Sorted list of SKILL.md paths, one per skill subdirectory.
+        """
+        if self.deep_scan:
+            return sorted(self.skills_directory.rglob("SKILL.md"))
+
+        # SKILL.md lives at the top level of each skill directory, so a
+        # shallow scan avoids descending into scripts/, references/, etc.
+        paths = []
+        for entry in os.scandir(self.skills_directory):
+            if entry.is_dir(follow_symlinks=False):
+                candidate = Path(entry.path) / "SKILL.md"
+                if candidate.is_file():
+                    paths.append(candidate)
+        return sorted(paths)
+
     def parse_skill_metadata(self, skill_md_path: Path) -> SkillMetadata:
         """Parse frontmatter from a SKILL.md file.
 
@@ -93,7 +309,42 @@ class SkillParser:
         ValueError
             If frontmatter is missing or invalid.
         """
-        content = skill_md_path.read_text(encoding="utf-8")
+        buf = self._read_frontmatter_bytes(skill_md_path)
+
+        # Fast path: flat frontmatter scanned at the bytes level
+        if _extract_name_desc is not None:
+            fields = _extract_name_desc(buf)
+            if fields is not None:
+                return SkillMetadata(
+                    name=fields[0],
+                    description=fields[1],
+                    skill_path=skill_md_path.parent,
+                )
+
+        return self.parse_skill_metadata_text(buf.decode("utf-8"), skill_md_path)
+
+    def parse_skill_metadata_text(self, content: str, skill_md_path: Path) -> SkillMetadata:
+        """Parse frontmatter from SKILL.md content already held in memory.
+
+        Parameters
+        ----------
+        content : str
+            SKILL.md content, covering at least the closing frontmatter
+            delimiter.
+        skill_md_path : Path
+            Path the content belongs to; used for error messages and to
+            derive the skill directory.
+
+        Returns
+        -------
+        SkillMetadata
+            Parsed skill metadata.
+
+        Raises
+        ------
+        ValueError
+            If frontmatter is missing or invalid.
+        """
         frontmatter = self._extract_frontmatter(content)
 
         # Validate required fields
@@ -108,6 +359,67 @@ class SkillParser:
             skill_path=skill_md_path.parent,
         )
 
+    def _get_skill_by_name(self, skill_name: str) -> SkillMetadata:
+        """Look up a skill by name via the cached name index.
+
+        Parameters
+        ----------
+        skill_name : str
+            Name of the skill.
+
+        Returns
+        -------
+        SkillMetadata
+            Metadata for the matching skill.
+
+        Raises
+        ------
+        ValueError
+            If no skill with that name exists.
+        """
+        self.find_all_skills()  # refresh the cache and index if stale
+        skill = self._skills_by_name.get(skill_name)
+        if skill is None:
+            raise ValueError(f"Skill '{skill_name}' not found")
+        return skill
+
+    @staticmethod
+    def _read_frontmatter_bytes(path: Path, max_bytes: int = 8192) -> bytes:
+        """Read just enough of a SKILL.md file to cover its frontmatter.
+
+        Metadata parsing only needs the leading frontmatter block, so there
+        is no reason to slurp and decode multi-KB markdown bodies. Reads a
+        window from the start of the file, doubling it until the closing
+        ``---`` delimiter appears or the file is exhausted.
+
+        Parameters
+        ----------
+        path : Path
+            Path to the SKILL.md file.
+        max_bytes : int
+            Initial read window size in bytes.
+
+        Returns
+        -------
+        bytes
+            File content up to and including the closing delimiter, or the
+            full file if no delimiter was found. Cutting at the ASCII
+            delimiter guarantees a decode never splits a multi-byte
+            character at the window boundary.
+        """
+        with path.open("rb") as f:
+            buf = f.read(max_bytes)
+            while b"\n---" not in buf:
+                chunk = f.read(len(buf))
+                if not chunk:
+                    break
+                buf += chunk
+
+        end = buf.find(b"\n---")
+        if end >= 0:
+            buf = buf[: end + 4]
+        return buf
+
     def _extract_frontmatter(self, content: str) -> dict[str, Any]:
         """Extract YAML frontmatter from SKILL.md content.
 
@@ -126,19 +438,64 @@ class SkillParser:
         ValueError
             If frontmatter is not found or invalid.
         """
-        # Match frontmatter between --- delimiters at start of file
-        pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(pattern, content, re.DOTALL)
-
-        if not match:
+        # Frontmatter sits between --- delimiters at the start of the file.
+        # The delimiters are fixed strings, so plain string operations find
+        # them without scanning the whole markdown body.
+        if not content.startswith("---"):
+            raise ValueError("No valid YAML frontmatter found")
+        start = content.find("\n")
+        if start < 0 or content[3:start].strip():
             raise ValueError("No valid YAML frontmatter found")
+        end = content.find("\n---", start)
+        if end < 0:
+            raise ValueError("No valid YAML frontmatter found")
+
+        yaml_content = content[start + 1 : end]
+        result = self._scan_flat_frontmatter(yaml_content)
+        if result is not None:
+            return result
 
-        yaml_content = match.group(1)
+        # Fallback for frontmatter that is not a flat key/value block
         try:
-            return yaml.safe_load(yaml_content)
+            return yaml.load(yaml_content, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML in frontmatter: {e}") from e
 
+    @staticmethod
+    def _scan_flat_frontmatter(yaml_content: str) -> dict[str, Any] | None:
+        """Parse a flat ``key: value`` frontmatter block without YAML.
+
+        SKILL.md frontmatter is conventionally a flat mapping of scalar
+        strings (``name``, ``description``), which does not need the full
+        YAML state machine.
+
+        Parameters
+        ----------
+        yaml_content : str
+            Raw text between the frontmatter delimiters.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            Parsed mapping, or None if the block uses YAML features this
+            fast path does not handle (nesting, lists, flow style, ...).
+        """
+        result: dict[str, Any] = {}
+        for line in yaml_content.splitlines():
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            # Indented lines, list items, and flow collections need real YAML
+            if line[0] in (" ", "\t", "-", "{", "["):
+                return None
+            key, sep, value = line.partition(":")
+            if not sep:
+                return None
+            # Inline comments (and '#' inside quoted scalars) need real YAML
+            if "#" in value:
+                return None
+            result[key.strip()] = value.strip().strip('"').strip("'")
+        return result
+
     def get_skill_content(
         self, skill_name: str, return_type: str = "both"
     ) -> "str | dict[str, str]":
@@ -166,22 +523,8 @@ class SkillParser:
         if return_type not in ("content", "file_path", "both"):
             raise ValueError(f"Invalid return_type: {return_type}. Must be 'content', 'file_path', or 'both'")
 
-        skills = self.find_all_skills()
-        for skill in skills:
-            if skill.name == skill_name:
-                skill_md_path = skill.skill_path / "SKILL.md"
-
-                if return_type == "content":
-                    return skill_md_path.read_text(encoding="utf-8")
-                elif return_type == "file_path":
-                    return str(skill_md_path.resolve())
-                else:  # both
-                    return {
-                        "content": skill_md_path.read_text(encoding="utf-8"),
-                        "file_path": str(skill_md_path.resolve()),
-                    }
-
-        raise ValueError(f"Skill '{skill_name}' not found")
+        skill = self._get_skill_by_name(skill_name)
+        return self._skill_content(skill, return_type)
 
     def list_skill_files(self, skill_name: str, relative: bool = True) -> "list[str]":
         """List all files in a skill directory recursively.
@@ -203,20 +546,102 @@ class SkillParser:
         ValueError
             If skill is not found.
         """
-        skills = self.find_all_skills()
-        for skill in skills:
-            if skill.name == skill_name:
-                files = []
-                for file_path in skill.skill_path.rglob("*"):
-                    if file_path.is_file():
-                        if relative:
-                            rel_path = file_path.relative_to(skill.skill_path)
-                            files.append(str(rel_path))
-                        else:
-                            files.append(str(file_path))
-                return sorted(files)
-
-        raise ValueError(f"Skill '{skill_name}' not found")
+        skill = self._get_skill_by_name(skill_name)
+        return self._walk_skill_files(skill, relative)
+
+    @staticmethod
+    def _skill_content(skill: SkillMetadata, return_type: str) -> "str | dict[str, str]":
+        """Build the SKILL.md content payload for an already-resolved skill.
+
+        Parameters
+        ----------
+        skill : SkillMetadata
+            Metadata of the skill to read.
+        return_type : str
+            Type of data to return: "content", "file_path", or "both".
+
+        Returns
+        -------
+        str | dict[str, str]
+            Content, file path, or both, depending on return_type.
+        """
+        skill_md_path = skill.skill_path / "SKILL.md"
+
+        if return_type == "file_path":
+            return str(skill.resolved_path / "SKILL.md")
+
+        content = _read_text(skill_md_path)
+        if return_type == "content":
+            return content
+        else:  # both
+            return {
+                "content": content,
+                "file_path": str(skill.resolved_path / "SKILL.md"),
+            }
+
+    @staticmethod
+    def _walk_skill_files(skill: SkillMetadata, relative: bool) -> list[str]:
+        """Walk an already-resolved skill's directory and collect its files.
+
+        Parameters
+        ----------
+        skill : SkillMetadata
+            Metadata of the skill to walk.
+        relative : bool
+            If True, return paths relative to the skill directory.
+
+        Returns
+        -------
+        list[str]
+            Sorted list of file paths.
+        """
+        skill_root = str(skill.skill_path)
+        files = []
+        for root, dirs, filenames in os.walk(skill_root):
+            # Prune junk directories in place so os.walk never descends
+            dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+            for filename in filenames:
+                # Plain string joins; no Path allocations inside the loop
+                full_path = os.path.join(root, filename)
+                if relative:
+                    files.append(os.path.relpath(full_path, skill_root))
+                else:
+                    files.append(full_path)
+        return sorted(files)
+
+    def get_skill_details(self, skill_name: str, return_type: str = "both") -> dict[str, Any]:
+        """Get a skill's SKILL.md content and file listing in one operation.
+
+        Resolves the skill once and serves both parts from it, instead of
+        requiring separate get_skill_content and list_skill_files calls that
+        each look the skill up again.
+
+        Parameters
+        ----------
+        skill_name : str
+            Name of the skill.
+        return_type : str
+            Type of skill content to return: "content", "file_path", or "both" (default).
+
+        Returns
+        -------
+        dict[str, Any]
+            Dictionary with "skill_content" (per return_type) and "files"
+            (relative paths within the skill directory).
+
+        Raises
+        ------
+        ValueError
+            If skill is not found or return_type is invalid.
+        """
+        if return_type not in ("content", "file_path", "both"):
+            raise ValueError(f"Invalid return_type: {return_type}. Must be 'content', 'file_path', or 'both'")
+
+        skill = self._get_skill_by_name(skill_name)
+        return {
+            "skill_content": self._skill_content(skill, return_type),
+            "files": self._walk_skill_files(skill, relative=True),
+        }
 
     def get_skill_file(
         self, skill_name: str, relative_path: str, return_type: str = "both"
@@ -247,28 +672,34 @@ class SkillParser:
         if return_type not in ("content", "file_path", "both"):
             raise ValueError(f"Invalid return_type: {return_type}. Must be 'content', 'file_path', or 'both'")
 
-        skills = self.find_all_skills()
-        for skill in skills:
-            if skill.name == skill_name:
-                # Validate path to prevent directory traversal
-                file_path = (skill.skill_path / relative_path).resolve()
-                if not file_path.is_relative_to(skill.skill_path.resolve()):
-                    raise ValueError("Invalid path: attempting to access files outside skill directory")
-
-                if not file_path.exists():
-                    raise ValueError(f"File not found: {relative_path}")
-
-                if not file_path.is_file():
-                    raise ValueError(f"Path is not a file: {relative_path}")
-
-                if return_type == "content":
-                    return file_path.read_text(encoding="utf-8")
-                elif return_type == "file_path":
-                    return str(file_path)
-                else:  # both
-                    return {
-                        "content": file_path.read_text(encoding="utf-8"),
-                        "file_path": str(file_path),
-                    }
-
-        raise ValueError(f"Skill '{skill_name}' not found")
+        # Reject traversal attempts before touching the filesystem at all
+        normalized = os.path.normpath(relative_path)
+        if os.path.isabs(normalized) or normalized == ".." or normalized.startswith(".." + os.sep):
+            raise ValueError("Invalid path: attempting to access files outside skill directory")
+
+        skill = self._get_skill_by_name(skill_name)
+
+        # Resolve the candidate (following symlinks) and check containment
+        # against the skill root cached at construction time
+        candidate = os.path.join(str(skill.resolved_path), normalized)
+        file_path = Path(os.path.realpath(candidate))
+        if not file_path.is_relative_to(skill.resolved_path):
+            raise ValueError("Invalid path: attempting to access files outside skill directory")
+
+        if not file_path.exists():
+            raise ValueError(f"File not found: {relative_path}")
+
+        if not file_path.is_file():
+            raise ValueError(f"Path is not a file: {relative_path}")
+
+        if return_type == "file_path":
+            return str(file_path)
+
+        content = _read_text(file_path)
+        if return_type == "content":
+            return content
+        else:  # both
+            return {
+                "content": content,
+                "file_path": str(file_path),
+            }
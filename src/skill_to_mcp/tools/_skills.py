@@ -1,13 +1,16 @@
 """MCP tools for accessing Claude Skills from the skills directory."""
 
 from pathlib import Path
+from typing import Any
 
 from fastmcp import FastMCP
 
 from skill_to_mcp.skill_parser import SkillParser
 
 
-def register_skill_tools(mcp_server: FastMCP, skills_dir: str | Path) -> None:
+def register_skill_tools(
+    mcp_server: FastMCP, skills_dir: str | Path, skill_parser: SkillParser | None = None
+) -> None:
     """Register skill tools with the MCP server.
 
     Parameters
@@ -16,9 +19,18 @@ def register_skill_tools(mcp_server: FastMCP, skills_dir: str | Path) -> None:
         The FastMCP server instance to register tools with.
     skills_dir : str | Path
         Path to the directory containing skill subdirectories.
+    skill_parser : SkillParser | None
+        Existing parser to reuse (e.g. one whose caches are already warm).
+        By default a new parser is created for the skills directory.
     """
     # Initialize the skill parser with the provided skills directory
-    skill_parser = SkillParser(skills_dir)
+    if skill_parser is None:
+        skill_parser = SkillParser(skills_dir)
+
+    # Serialized skill overview, keyed on the identity of the list the
+    # parser returns: find_all_skills hands back the same list object on a
+    # cache hit and a new one after a re-scan
+    _overview_cache: dict[str, Any] = {"source": None, "value": None}
 
     @mcp_server.tool()
     def get_available_skills() -> list[dict[str, str]]:
@@ -45,7 +57,10 @@ def register_skill_tools(mcp_server: FastMCP, skills_dir: str | Path) -> None:
         'single-cell-rna-qc'
         """
         skills = skill_parser.find_all_skills()
-        return [skill.to_dict() for skill in skills]
+        if skills is not _overview_cache["source"]:
+            _overview_cache["source"] = skills
+            _overview_cache["value"] = [skill.to_dict() for skill in skills]
+        return _overview_cache["value"]
 
     @mcp_server.tool()
     def get_skill_details(skill_name: str, return_type: str = "both") -> dict[str, any]:
@@ -84,18 +99,14 @@ def register_skill_tools(mcp_server: FastMCP, skills_dir: str | Path) -> None:
         ['SKILL.md', 'scripts/qc_analysis.py', ...]
         """
         try:
-            skill_content = skill_parser.get_skill_content(skill_name, return_type=return_type)
-            files = skill_parser.list_skill_files(skill_name, relative=True)
-
-            return {
-                "skill_content": skill_content,
-                "files": files,
-            }
+            return skill_parser.get_skill_details(skill_name, return_type=return_type)
         except ValueError as e:
             raise ValueError(f"Error getting skill details: {e}") from e
 
     @mcp_server.tool()
-    def get_skill_related_file(skill_name: str, relative_path: str, return_type: str = "both") -> "str | dict[str, str]":
+    def get_skill_related_file(
+        skill_name: str, relative_path: str, return_type: str = "both"
+    ) -> "str | dict[str, str]":
         """Read the content of a specific file within a skill directory.
 
         This tool returns the requested file based on a path relative to the skill's
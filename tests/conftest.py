@@ -1 +1,59 @@
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
 pytest_plugins = ("pytest_asyncio",)
+
+# Resolved once at import; the absolute path also matches the cache key
+# initialize_mcp uses, so all test modules share one server instance
+SKILLS_DIR = Path(__file__).resolve().parent.parent / "skills"
+
+
+@pytest.fixture(scope="session")
+def skills_dir():
+    """Get the skills directory path for testing."""
+    return SKILLS_DIR
+
+
+@pytest.fixture(scope="session")
+def parser(skills_dir):
+    """Create a SkillParser instance, shared across the session."""
+    from skill_to_mcp.skill_parser import SkillParser
+
+    return SkillParser(skills_dir)
+
+
+@pytest.fixture(scope="session")
+def mcp(skills_dir, parser):
+    """Initialize MCP server with test skills directory, once per session.
+
+    The server reuses the session parser, so the parser tests and the tool
+    tests share one scan of the skills directory.
+    """
+    from skill_to_mcp.mcp import initialize_mcp
+
+    return initialize_mcp(skills_dir, parser=parser)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(mcp):
+    """Connected MCP client shared by all tool-call tests.
+
+    Opening the session once avoids repeating the MCP initialize/shutdown
+    handshake per test; the tests only issue read-only tool calls.
+    """
+    from fastmcp import Client
+
+    async with AsyncExitStack() as stack:
+        yield await stack.enter_async_context(Client(mcp))
+
+
+@pytest_asyncio.fixture(scope="session")
+async def first_skill_name(client):
+    """Name of the first available skill, discovered once per session."""
+    result = await client.call_tool("get_available_skills", {})
+    skills = result.structured_content["result"]
+    assert len(skills) > 0, "test skills directory contains no skills"
+    return skills[0]["name"]
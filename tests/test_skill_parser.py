@@ -1,22 +1,16 @@
 """Tests for skill parser module."""
 
+import json
+import os
+import re
 from pathlib import Path
 
 import pytest
 
 from skill_to_mcp.skill_parser import SkillMetadata, SkillParser
 
-
-@pytest.fixture
-def skills_dir():
-    """Get the skills directory path."""
-    return Path(__file__).parent.parent / "skills"
-
-
-@pytest.fixture
-def parser(skills_dir):
-    """Create a SkillParser instance."""
-    return SkillParser(skills_dir)
+SKILL_NOT_FOUND = re.compile("Skill .* not found")
+INVALID_RETURN_TYPE = re.compile("Invalid return_type")
 
 
 def test_skills_directory_exists(skills_dir):
@@ -110,13 +104,13 @@ def test_get_skill_content_invalid_return_type(parser):
     skills = parser.find_all_skills()
     if len(skills) > 0:
         skill_name = skills[0].name
-        with pytest.raises(ValueError, match="Invalid return_type"):
+        with pytest.raises(ValueError, match=INVALID_RETURN_TYPE):
             parser.get_skill_content(skill_name, return_type="invalid")
 
 
 def test_get_skill_content_not_found(parser):
     """Test getting content for non-existent skill."""
-    with pytest.raises(ValueError, match="Skill .* not found"):
+    with pytest.raises(ValueError, match=SKILL_NOT_FOUND):
         parser.get_skill_content("nonexistent-skill")
 
 
@@ -145,9 +139,24 @@ def test_list_skill_files_absolute(parser):
         assert all(Path(f).is_absolute() for f in files)
 
 
+def test_list_skill_files_reflects_new_files(tmp_path):
+    """Test that files added in subdirectories appear in later listings."""
+    skills = tmp_path / "skills"
+    scripts = skills / "demo" / "scripts"
+    scripts.mkdir(parents=True)
+    (skills / "demo" / "SKILL.md").write_text("---\nname: demo\ndescription: Demo skill\n---\n# Demo")
+    (scripts / "a.py").write_text("print('a')\n")
+
+    parser = SkillParser(skills)
+    assert os.path.join("scripts", "a.py") in parser.list_skill_files("demo")
+
+    (scripts / "b.py").write_text("print('b')\n")
+    assert os.path.join("scripts", "b.py") in parser.list_skill_files("demo")
+
+
 def test_list_skill_files_not_found(parser):
     """Test listing files for non-existent skill."""
-    with pytest.raises(ValueError, match="Skill .* not found"):
+    with pytest.raises(ValueError, match=SKILL_NOT_FOUND):
         parser.list_skill_files("nonexistent-skill")
 
 
@@ -193,7 +202,7 @@ def test_get_skill_file_invalid_return_type(parser):
     skills = parser.find_all_skills()
     if len(skills) > 0:
         skill_name = skills[0].name
-        with pytest.raises(ValueError, match="Invalid return_type"):
+        with pytest.raises(ValueError, match=INVALID_RETURN_TYPE):
             parser.get_skill_file(skill_name, "SKILL.md", return_type="invalid")
 
 
@@ -215,6 +224,22 @@ def test_get_skill_file_directory_traversal(parser):
             parser.get_skill_file(skill_name, "../../../etc/passwd")
 
 
+def test_get_skill_file_symlink_traversal(tmp_path):
+    """Test that symlinks pointing outside the skill directory are rejected."""
+    outside = tmp_path / "secret.txt"
+    outside.write_text("secret")
+
+    skills = tmp_path / "skills"
+    skill = skills / "demo"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: demo\ndescription: Demo skill\n---\n# Demo")
+    (skill / "link.txt").symlink_to(outside)
+
+    parser = SkillParser(skills)
+    with pytest.raises(ValueError, match="Invalid path"):
+        parser.get_skill_file("demo", "link.txt")
+
+
 def test_get_skill_file_is_directory(parser):
     """Test getting a directory instead of a file."""
     skills = parser.find_all_skills()
@@ -229,6 +254,71 @@ def test_get_skill_file_is_directory(parser):
                 parser.get_skill_file(skill_name, subdir_name)
 
 
+def test_find_all_skills_reflects_edits(tmp_path, monkeypatch):
+    """Test that in-place SKILL.md edits invalidate the in-memory cache."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+
+    skills = tmp_path / "skills"
+    skill = skills / "demo"
+    skill.mkdir(parents=True)
+    skill_md = skill / "SKILL.md"
+    skill_md.write_text("---\nname: demo\ndescription: Demo skill\n---\n# Demo")
+
+    parser = SkillParser(skills)
+    assert [s.name for s in parser.find_all_skills()] == ["demo"]
+
+    # Editing the file does not touch the skills directory's own mtime,
+    # so the cache must key on the files themselves
+    skill_md.write_text("---\nname: demo-updated\ndescription: Demo skill\n---\n# Demo")
+    assert [s.name for s in parser.find_all_skills()] == ["demo-updated"]
+
+
+def test_find_all_skills_snapshot(tmp_path, monkeypatch):
+    """Test the disk snapshot: cold write, warm hydrate, and invalidation."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+
+    skills = tmp_path / "skills"
+    skill = skills / "demo"
+    skill.mkdir(parents=True)
+    skill_md = skill / "SKILL.md"
+    skill_md.write_text("---\nname: demo\ndescription: Demo skill\n---\n# Demo")
+
+    # Cold scan writes the snapshot
+    cold = SkillParser(skills).find_all_skills()
+    assert [s.name for s in cold] == ["demo"]
+    snapshot = SkillParser(skills)._snapshot_path()
+    assert snapshot.exists()
+
+    # A fresh parser hydrates from the snapshot; tamper with the stored
+    # name (keeping the manifest intact) to prove no re-parse happens
+    data = json.loads(snapshot.read_text())
+    data["skills"][0]["name"] = "from-snapshot"
+    snapshot.write_text(json.dumps(data))
+    warm = SkillParser(skills).find_all_skills()
+    assert [s.name for s in warm] == ["from-snapshot"]
+
+    # Changing the SKILL.md invalidates the manifest and forces a re-scan
+    skill_md.write_text("---\nname: demo-updated\ndescription: Demo skill\n---\n# Demo")
+    updated = SkillParser(skills).find_all_skills()
+    assert [s.name for s in updated] == ["demo-updated"]
+
+
+def test_find_all_skills_snapshot_corrupted(tmp_path, monkeypatch):
+    """Test that unreadable or wrong-shaped snapshots fall back to a scan."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+
+    skills = tmp_path / "skills"
+    skill = skills / "demo"
+    skill.mkdir(parents=True)
+    (skill / "SKILL.md").write_text("---\nname: demo\ndescription: Demo skill\n---\n# Demo")
+
+    snapshot = SkillParser(skills)._snapshot_path()
+    snapshot.parent.mkdir(parents=True, exist_ok=True)
+    for corrupt in ("not json", "[]", '"truncated"'):
+        snapshot.write_text(corrupt)
+        assert [s.name for s in SkillParser(skills).find_all_skills()] == ["demo"]
+
+
 def test_parse_skill_metadata_single_cell_rna_qc(parser, skills_dir):
     """Test parsing the single-cell-rna-qc skill specifically."""
     skill_md = skills_dir / "single-cell-rna-qc" / "SKILL.md"
@@ -239,29 +329,40 @@ def test_parse_skill_metadata_single_cell_rna_qc(parser, skills_dir):
         assert metadata.skill_path == skill_md.parent
 
 
-def test_frontmatter_validation(parser, tmp_path):
-    """Test frontmatter validation with invalid SKILL.md files."""
-    # Create a temporary skill directory
-    temp_skill = tmp_path / "test-skill"
-    temp_skill.mkdir()
+def test_fastscan_bails_on_inline_comment():
+    """Test that the bytes fast path defers values with '#' to the YAML path."""
+    from skill_to_mcp._fastscan import extract_name_desc
+
+    assert extract_name_desc(b"---\nname: demo\ndescription: Demo skill\n---\n") == ("demo", "Demo skill")
+    assert extract_name_desc(b"---\nname: demo\ndescription: Demo skill  # note\n---\n") is None
+
+
+def test_frontmatter_inline_comment(parser):
+    """Test that inline comments in frontmatter values are stripped like YAML."""
+    skill_md = Path("test-skill") / "SKILL.md"
+    content = "---\nname: test\ndescription: Demo skill  # note\n---\n# Content"
+    metadata = parser.parse_skill_metadata_text(content, skill_md)
+    assert metadata.description == "Demo skill"
+
+
+def test_frontmatter_validation(parser):
+    """Test frontmatter validation with invalid SKILL.md content."""
+    skill_md = Path("test-skill") / "SKILL.md"
 
     # Test missing frontmatter
-    skill_md = temp_skill / "SKILL.md"
-    skill_md.write_text("# No frontmatter here")
     with pytest.raises(ValueError, match="No valid YAML frontmatter found"):
-        parser.parse_skill_metadata(skill_md)
+        parser.parse_skill_metadata_text("# No frontmatter here", skill_md)
 
     # Test missing name field
-    skill_md.write_text("---\ndescription: Test\n---\n# Content")
     with pytest.raises(ValueError, match="Missing 'name' field"):
-        parser.parse_skill_metadata(skill_md)
+        parser.parse_skill_metadata_text("---\ndescription: Test\n---\n# Content", skill_md)
 
     # Test missing description field
-    skill_md.write_text("---\nname: test\n---\n# Content")
     with pytest.raises(ValueError, match="Missing 'description' field"):
-        parser.parse_skill_metadata(skill_md)
+        parser.parse_skill_metadata_text("---\nname: test\n---\n# Content", skill_md)
 
     # Test invalid YAML syntax (tabs in YAML are not allowed)
-    skill_md.write_text("---\nname: test\ndescription: test\n\tinvalid: yaml\n---\n# Content")
     with pytest.raises(ValueError, match="Invalid YAML"):
-        parser.parse_skill_metadata(skill_md)
+        parser.parse_skill_metadata_text(
+            "---\nname: test\ndescription: test\n\tinvalid: yaml\n---\n# Content", skill_md
+        )